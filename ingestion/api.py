@@ -32,8 +32,8 @@ async def trigger_ingestion(source_ids: list[str] = None):
     from uuid import uuid4
     
     if not source_ids:
-        from core.registry import SourceRegistry
-        registry = SourceRegistry()
+        from core.registry import get_registry
+        registry = get_registry()
         sources = registry.list_sources(active_only=True)
         source_ids = [str(s.config.source_id) for s in sources]
     
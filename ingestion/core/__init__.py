@@ -3,13 +3,14 @@
 from .config import Settings, get_settings
 from .logging import setup_logging, get_logger
 from .storage import StorageManager
-from .registry import SourceRegistry
+from .registry import SourceRegistry, get_registry
 
 __all__ = [
     "Settings",
-    "get_settings", 
+    "get_settings",
     "setup_logging",
     "get_logger",
     "StorageManager",
     "SourceRegistry",
+    "get_registry",
 ] 
\ No newline at end of file
@@ -1,11 +1,26 @@
 """Source registry module for managing compliance document sources."""
 
+import functools
+
 from .source_registry import SourceRegistry
 from .file_manager import SourceFileManager
 from .regional_manager import RegionalManager
 
+
+@functools.lru_cache(maxsize=1)
+def get_registry() -> SourceRegistry:
+    """Get the process-wide SourceRegistry instance.
+
+    Constructing a SourceRegistry re-reads and validates every source YAML
+    file, so event handlers should share one instance per process. Call
+    get_registry.cache_clear() after rewriting source files on disk.
+    """
+    return SourceRegistry()
+
+
 __all__ = [
     "SourceRegistry",
-    "SourceFileManager", 
+    "get_registry",
+    "SourceFileManager",
     "RegionalManager",
-] 
\ No newline at end of file
+]
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Main source registry for managing source configurations."""
 
+import time
+from datetime import timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from core.config import get_settings
@@ -12,6 +14,15 @@ from .regional_manager import RegionalManager
 
 logger = get_logger(__name__)
 
+# Fetch intervals in seconds, keyed by SourceConfig.fetch_frequency.
+# Frequencies without an interval (e.g. "on_demand") are never considered due.
+_FETCH_INTERVAL_SECONDS = {
+    'daily': 86400.0,
+    'weekly': 604800.0,
+    'monthly': 2592000.0,
+    'quarterly': 7776000.0,
+}
+
 
 class SourceRegistry:
     """Registry for managing source configurations."""
@@ -54,6 +65,18 @@ class SourceRegistry:
                 return source
         return None
     
+    def get_active_sources(self, source_ids: Iterable[UUID]) -> List[Source]:
+        """Get active sources for a batch of IDs in a single traversal.
+
+        Unknown IDs and inactive sources are silently dropped, so callers
+        can validate a whole batch without a lookup-and-check per element.
+        """
+        return [
+            source
+            for source in (self._sources.get(source_id) for source_id in source_ids)
+            if source is not None and source.config.is_active
+        ]
+
     def list_sources(self, active_only: bool = False) -> List[Source]:
         """List all sources."""
         sources = list(self._sources.values())
@@ -88,6 +111,7 @@ class SourceRegistry:
         source.total_documents_fetched = old_source.total_documents_fetched
         source.successful_fetches = old_source.successful_fetches
         source.failed_fetches = old_source.failed_fetches
+        source.total_fetch_time = old_source.total_fetch_time
         source.average_fetch_time = old_source.average_fetch_time
         
         self._sources[source_id] = source
@@ -143,6 +167,39 @@ class SourceRegistry:
             if source.config.source_type == source_type
         ]
     
+    def get_sources_due_for_fetch(self) -> List[Source]:
+        """Get active sources whose fetch interval has elapsed.
+
+        The cutoff comparison is done on epoch floats against a single
+        timestamp taken once per call, so filtering large registries does
+        not allocate a timedelta per source.
+        """
+        now_ts = time.time()
+
+        due_sources = []
+        for source in self._sources.values():
+            config = source.config
+            if not config.is_active:
+                continue
+
+            interval = _FETCH_INTERVAL_SECONDS.get(config.fetch_frequency)
+            if interval is None:
+                continue
+
+            last_fetched = config.last_fetched
+            if last_fetched is None:
+                due_sources.append(source)
+                continue
+
+            if last_fetched.tzinfo is None:
+                # Stored timestamps are naive UTC (datetime.utcnow()).
+                last_fetched = last_fetched.replace(tzinfo=timezone.utc)
+
+            if now_ts - last_fetched.timestamp() >= interval:
+                due_sources.append(source)
+
+        return due_sources
+
     def get_sources_by_priority(self, min_priority: int = 1) -> List[Source]:
         """Get sources by minimum priority, sorted by priority (highest first)."""
         sources = [
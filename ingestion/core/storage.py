@@ -1,5 +1,6 @@
 """Storage management for documents and metadata."""
 
+import asyncio
 import hashlib
 import json
 import shutil
@@ -28,6 +29,9 @@ class StorageManager:
         self.parsed_dir = self.settings.parsed_output_path
         self.metadata_dir = self.settings.metadata_output_path
         self.logs_dir = self.settings.logs_output_path
+        # Per-source {file_hash: doc_id} indexes for duplicate checks,
+        # keyed by the metadata dir's mtime so new saves invalidate.
+        self._hash_index: Dict[str, tuple] = {}
     
     async def save_raw_content(
         self, 
@@ -37,7 +41,8 @@ class StorageManager:
         extension: str = "bin"
     ) -> Path:
         """Save raw document content to storage."""
-        filename = f"{document_id}.{extension}"
+        doc_id = str(document_id)
+        filename = f"{doc_id}.{extension}"
         source_dir = self.raw_dir / source_name
         source_dir.mkdir(parents=True, exist_ok=True)
         
@@ -52,7 +57,7 @@ class StorageManager:
         
         logger.info(
             "Saved raw content",
-            document_id=str(document_id),
+            document_id=doc_id,
             source_name=source_name,
             file_path=str(file_path),
             file_size=len(content)
@@ -68,7 +73,8 @@ class StorageManager:
         format_type: str = "txt"
     ) -> Path:
         """Save parsed document content to storage."""
-        filename = f"{document_id}.{format_type}"
+        doc_id = str(document_id)
+        filename = f"{doc_id}.{format_type}"
         source_dir = self.parsed_dir / source_name
         source_dir.mkdir(parents=True, exist_ok=True)
         
@@ -79,7 +85,7 @@ class StorageManager:
         
         logger.info(
             "Saved parsed content",
-            document_id=str(document_id),
+            document_id=doc_id,
             source_name=source_name,
             file_path=str(file_path),
             content_length=len(content)
@@ -94,25 +100,33 @@ class StorageManager:
         format_type: str = "yaml"
     ) -> Path:
         """Save document metadata to storage."""
-        filename = f"{metadata.doc_id}.{format_type}"
+        doc_id = str(metadata.doc_id)
+        filename = f"{doc_id}.{format_type}"
         source_dir = self.metadata_dir / source_name
         source_dir.mkdir(parents=True, exist_ok=True)
         
         file_path = source_dir / filename
         
-        # Convert to dict for serialization
+        # Convert to dict for serialization; the dump itself is
+        # CPU-bound and runs on a worker thread so concurrent saves
+        # don't stall the event loop behind YAML emission.
         metadata_dict = metadata.dict()
-        
+
         if format_type == "yaml":
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(yaml.dump(metadata_dict, default_flow_style=False))
+            payload = await asyncio.to_thread(
+                yaml.dump, metadata_dict, default_flow_style=False
+            )
         else:  # json
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(metadata_dict, indent=2, default=str))
+            payload = await asyncio.to_thread(
+                json.dumps, metadata_dict, indent=2, default=str
+            )
+
+        async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+            await f.write(payload)
         
         logger.info(
             "Saved metadata",
-            document_id=str(metadata.doc_id),
+            document_id=doc_id,
             source_name=source_name,
             file_path=str(file_path)
         )
@@ -126,7 +140,8 @@ class StorageManager:
         format_type: str = "yaml"
     ) -> Optional[DocumentMetadata]:
         """Load document metadata from storage."""
-        filename = f"{document_id}.{format_type}"
+        doc_id = str(document_id)
+        filename = f"{doc_id}.{format_type}"
         file_path = self.metadata_dir / source_name / filename
         
         if not file_path.exists():
@@ -137,7 +152,7 @@ class StorageManager:
                 content = await f.read()
             
             if format_type == "yaml":
-                data = yaml.safe_load(content)
+                data = await asyncio.to_thread(yaml.safe_load, content)
             else:  # json
                 data = json.loads(content)
             
@@ -146,7 +161,7 @@ class StorageManager:
         except Exception as e:
             logger.error(
                 "Failed to load metadata",
-                document_id=str(document_id),
+                document_id=doc_id,
                 source_name=source_name,
                 error=str(e)
             )
@@ -155,9 +170,11 @@ class StorageManager:
     def calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA-256 hash of file."""
         hash_sha256 = hashlib.sha256()
-        
+
+        # 64 KiB blocks: hashlib's update is C-level either way, so
+        # bigger reads just mean fewer Python loop iterations per file.
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(1 << 16), b""):
                 hash_sha256.update(chunk)
         
         return hash_sha256.hexdigest()
@@ -167,24 +184,46 @@ class StorageManager:
         content_hash: str,
         source_name: str
     ) -> Optional[UUID]:
-        """Check if content already exists by hash."""
+        """Check if content already exists by hash.
+
+        Lookups hit an in-memory hash index per source instead of
+        re-parsing every metadata YAML on every call; the index is
+        rebuilt only when the source's metadata directory mtime moves
+        (i.e. a document was saved or removed).
+        """
         if not self.settings.enable_deduplication:
             return None
-        
-        # Search metadata files for matching hash
+
         source_metadata_dir = self.metadata_dir / source_name
-        
+
         if not source_metadata_dir.exists():
             return None
-        
+
+        dir_mtime_ns = source_metadata_dir.stat().st_mtime_ns
+        cached = self._hash_index.get(source_name)
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return cached[1].get(content_hash)
+
+        # Rebuilding parses every metadata YAML; keep that off the
+        # event loop so in-flight fetches aren't stalled behind it.
+        index = await asyncio.to_thread(self._build_hash_index, source_metadata_dir)
+
+        self._hash_index[source_name] = (dir_mtime_ns, index)
+        return index.get(content_hash)
+
+    @staticmethod
+    def _build_hash_index(source_metadata_dir: Path) -> Dict[str, UUID]:
+        """Scan a source's metadata files into a {file_hash: doc_id} map."""
+        index: Dict[str, UUID] = {}
         for metadata_file in source_metadata_dir.glob("*.yaml"):
             try:
                 with open(metadata_file, 'r', encoding='utf-8') as f:
                     data = yaml.safe_load(f)
-                
-                if data.get('file_hash') == content_hash:
-                    return UUID(data['doc_id'])
-            
+
+                file_hash = data.get('file_hash')
+                if file_hash:
+                    index[file_hash] = UUID(data['doc_id'])
+
             except Exception as e:
                 logger.warning(
                     "Error checking duplicate",
@@ -192,8 +231,8 @@ class StorageManager:
                     error=str(e)
                 )
                 continue
-        
-        return None
+
+        return index
     
     async def get_document_stats(self, source_name: str) -> Dict[str, int]:
         """Get statistics for documents in a source."""
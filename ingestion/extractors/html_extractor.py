@@ -1,5 +1,6 @@
 """HTML content extraction using site-specific extractors."""
 
+import asyncio
 import requests
 import logging
 from typing import List
@@ -78,14 +79,22 @@ class HTMLExtractor:
         return ""
     
     async def _fallback_extraction(self, url: str, raw_file_path: str) -> str:
-        """Fallback to simple requests extraction."""
+        """Fallback to simple requests extraction.
+
+        requests is synchronous, so the fetch + write runs on a worker
+        thread to keep the event loop free for other documents.
+        """
+        return await asyncio.to_thread(self._fallback_sync, url, raw_file_path)
+
+    def _fallback_sync(self, url: str, raw_file_path: str) -> str:
+        """Synchronous fetch + write; runs on a worker thread."""
         try:
             response = requests.get(url, timeout=self.timeout)
             response.raise_for_status()
-            
+
             with open(raw_file_path, 'w', encoding='utf-8') as f:
                 f.write(response.text)
-            
+
             return response.text
         except Exception as e:
             logger.error(f"Fallback extraction failed for {url}: {e}")
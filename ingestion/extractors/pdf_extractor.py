@@ -1,5 +1,6 @@
 """PDF content extraction using PyMuPDF."""
 
+import asyncio
 import requests
 from typing import Optional
 import logging
@@ -9,21 +10,43 @@ logger = logging.getLogger(__name__)
 
 class PDFExtractor:
     """Extracts content from PDF documents."""
-    
+
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
-    
+
     async def extract_content(self, url: str, raw_file_path: str) -> str:
-        """Extract text content from PDF files."""
+        """Extract text content from PDF files.
+
+        The download (requests) and parse (PyMuPDF) are both
+        synchronous, so the whole job runs on a worker thread rather
+        than blocking the event loop for seconds per document.
+        """
+        return await asyncio.to_thread(self._extract_sync, url, raw_file_path)
+
+    def _extract_sync(self, url: str, raw_file_path: str) -> str:
+        """Synchronous download + parse; runs on a worker thread."""
         try:
-            # Download PDF directly
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # Save raw PDF
-            with open(raw_file_path, 'wb') as f:
-                f.write(response.content)
-            
+            # Stream the download straight to disk; large regulation
+            # PDFs never need to sit fully in memory just to be written
+            # out, so peak RSS stays at one chunk instead of file size.
+            with requests.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=1 << 16)
+
+                # Magic-number check on the first chunk: endpoints that
+                # looked like PDFs by URL sometimes serve HTML error
+                # pages, and bailing here skips writing the junk file
+                # and the guaranteed-to-fail PyMuPDF open.
+                first_chunk = next(chunks, b'')
+                if not first_chunk.startswith(b'%PDF'):
+                    logger.warning(f"Content from {url} has no %PDF header, skipping")
+                    return ""
+
+                with open(raw_file_path, 'wb') as f:
+                    f.write(first_chunk)
+                    for chunk in chunks:
+                        f.write(chunk)
+
             # Extract text content using PyMuPDF
             import pymupdf as fitz
             doc = fitz.open(raw_file_path)
@@ -31,9 +54,9 @@ class PDFExtractor:
             for page in doc:
                 text_content += page.get_text()
             doc.close()
-            
+
             return text_content
-            
+
         except Exception as e:
             logger.error(f"PDF extraction failed for {url}: {e}")
-            return "" 
\ No newline at end of file
+            return ""
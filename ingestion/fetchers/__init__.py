@@ -1,13 +1,15 @@
 """Fetcher modules for different compliance document sources."""
 
+import functools
+
 from .base_fetcher import BaseFetcher, FetchResult
-from .fetch_nist import NISTFetcher
-from .fetch_eu_ai_act import EUAIActFetcher
-from .fetch_fpf import FPFFetcher
-from .fetch_us_gov import USGovernmentFetcher
-from .fetch_canada_gov import CanadianGovernmentFetcher
-from .fetch_uk_gov import UKGovernmentFetcher
-from .fetch_international_reg import InternationalRegulatoryFetcher
+from .north_america.fetch_nist import NISTFetcher
+from .europe.fetch_eu_ai_act import EUAIActFetcher
+from .international.fetch_fpf import FPFFetcher
+from .north_america.fetch_us_gov import USGovernmentFetcher
+from .north_america.fetch_canada_gov import CanadianGovernmentFetcher
+from .europe.fetch_uk_gov import UKGovernmentFetcher
+from .international.fetch_international_reg import InternationalRegulatoryFetcher
 
 __all__ = [
     'BaseFetcher',
@@ -47,13 +49,14 @@ FETCHER_REGISTRY = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def get_fetcher_class(source_type: str) -> type[BaseFetcher]:
     """Get the appropriate fetcher class for a source type."""
     source_type_lower = source_type.lower().replace('-', '_').replace(' ', '_')
-    
+
     if source_type_lower in FETCHER_REGISTRY:
         return FETCHER_REGISTRY[source_type_lower]
-    
+
     # Default fallback
     return InternationalRegulatoryFetcher
 
@@ -1,8 +1,11 @@
 """Fetcher for US Government AI guidance and executive orders."""
 
+import functools
+
 import aiohttp
 from typing import List, Optional
 from pathlib import Path
+from urllib.parse import urlparse
 
 from ..base_fetcher import BaseFetcher, FetchResult
 from ...models.source import Source
@@ -11,13 +14,53 @@ from ...core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Precomputed lookup tables so per-document classification avoids repeated
+# substring scans on the hot fetch path.
+_AGENCY_BY_HOST = {
+    'whitehouse.gov': 'Executive Office of the President',
+    'ftc.gov': 'Federal Trade Commission',
+    'nist.gov': 'National Institute of Standards and Technology',
+}
+
+_DOC_TYPE_KEYWORDS = (
+    ('executive-order', 'executive_order'),
+    ('presidential-actions', 'presidential_action'),
+    ('business-guidance', 'business_guidance'),
+    ('policy-reports', 'policy_report'),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _agency_for_url(url: str) -> str:
+    """Resolve the government agency for a URL via hostname lookup."""
+    host = urlparse(url).hostname or ''
+    if host.startswith('www.'):
+        host = host[4:]
+    return _AGENCY_BY_HOST.get(host, 'US Government')
+
 
 class USGovernmentFetcher(BaseFetcher):
     """Fetcher for US Government AI sources (White House, FTC, etc.)."""
-    
+
+    # (endpoint substring, filename stem) rules per hostname, checked in order.
+    _FILENAME_RULES = {
+        'whitehouse.gov': (
+            ('executive-order', 'us_executive_order_ai'),
+            ('presidential-actions', 'us_presidential_action_ai'),
+        ),
+        'ftc.gov': (
+            ('ai-claims', 'ftc_ai_claims_guidance'),
+            ('aiming-truth', 'ftc_ai_fairness_report'),
+        ),
+    }
+
+    _FILENAME_SANITIZE = str.maketrans('/-', '__')
+
     def __init__(self, source: Source):
         super().__init__(source)
         self.session_timeout = aiohttp.ClientTimeout(total=60)  # Longer timeout for gov sites
+        host = urlparse(str(self.source.config.base_url)).hostname or ''
+        self._host = host[4:] if host.startswith('www.') else host
     
     async def fetch_documents(self) -> List[FetchResult]:
         """Fetch documents from US Government sources."""
@@ -74,14 +117,16 @@ class USGovernmentFetcher(BaseFetcher):
                 
                 content = await response.read()
                 content_type = response.headers.get('content-type', '').lower()
-                
-                # Determine document format
-                if 'pdf' in content_type or endpoint.endswith('.pdf'):
+
+                # Determine document format from the leading bytes; the
+                # content-type header is only a hint (government servers
+                # frequently mislabel PDFs as HTML and vice versa).
+                if content[:5] == b'%PDF-':
+                    doc_format = DocumentFormat.PDF
+                    file_extension = '.pdf'
+                elif 'pdf' in content_type or endpoint.endswith('.pdf'):
                     doc_format = DocumentFormat.PDF
                     file_extension = '.pdf'
-                elif 'html' in content_type or 'text/html' in content_type:
-                    doc_format = DocumentFormat.HTML
-                    file_extension = '.html'
                 else:
                     # Default to HTML for government pages
                     doc_format = DocumentFormat.HTML
@@ -130,45 +175,25 @@ class USGovernmentFetcher(BaseFetcher):
     
     def _generate_filename(self, endpoint: str, extension: str) -> str:
         """Generate appropriate filename for US Government documents."""
-        # Extract meaningful name from endpoint
-        if 'whitehouse.gov' in str(self.source.config.base_url):
-            if 'executive-order' in endpoint:
-                return f"us_executive_order_ai{extension}"
-            elif 'presidential-actions' in endpoint:
-                return f"us_presidential_action_ai{extension}"
-        elif 'ftc.gov' in str(self.source.config.base_url):
-            if 'ai-claims' in endpoint:
-                return f"ftc_ai_claims_guidance{extension}"
-            elif 'aiming-truth' in endpoint:
-                return f"ftc_ai_fairness_report{extension}"
-        
+        # Extract meaningful name from endpoint via the per-host rule table
+        for substring, stem in self._FILENAME_RULES.get(self._host, ()):
+            if substring in endpoint:
+                return f"{stem}{extension}"
+
         # Fallback: use sanitized endpoint
-        safe_name = endpoint.replace('/', '_').replace('-', '_').strip('_')
+        safe_name = endpoint.translate(self._FILENAME_SANITIZE).strip('_')
         return f"us_gov_{safe_name}{extension}"
     
     def _determine_agency(self, url: str) -> str:
         """Determine the government agency from URL."""
-        if 'whitehouse.gov' in url:
-            return 'Executive Office of the President'
-        elif 'ftc.gov' in url:
-            return 'Federal Trade Commission'
-        elif 'nist.gov' in url:
-            return 'National Institute of Standards and Technology'
-        else:
-            return 'US Government'
-    
+        return _agency_for_url(url)
+
     def _determine_document_type(self, endpoint: str) -> str:
         """Determine document type from endpoint."""
-        if 'executive-order' in endpoint:
-            return 'executive_order'
-        elif 'presidential-actions' in endpoint:
-            return 'presidential_action'
-        elif 'business-guidance' in endpoint:
-            return 'business_guidance'
-        elif 'policy-reports' in endpoint:
-            return 'policy_report'
-        else:
-            return 'government_document'
+        for keyword, doc_type in _DOC_TYPE_KEYWORDS:
+            if keyword in endpoint:
+                return doc_type
+        return 'government_document'
     
     async def health_check(self) -> bool:
         """Check if US Government sources are accessible."""
@@ -1,5 +1,11 @@
 """Inngest client for compliance document ingestion."""
 
-from .client import inngest_client
+from .client import get_inngest_client
 
-__all__ = ["inngest_client"] 
\ No newline at end of file
+__all__ = ["inngest_client", "get_inngest_client"]
+
+
+def __getattr__(name: str):
+    if name == "inngest_client":
+        return get_inngest_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,28 @@
 """Inngest client configuration."""
 
-import os
+import functools
 import logging
-import inngest
 
-# Create Inngest client for dev mode
-inngest_client = inngest.Inngest(
-    app_id="compliance-ingestion",
-    logger=logging.getLogger("inngest"),
-) 
\ No newline at end of file
+
+@functools.lru_cache(maxsize=1)
+def get_inngest_client():
+    """Create the shared Inngest client on first use.
+
+    Importing the Inngest SDK pulls in its full dependency tree, so the
+    import is deferred until something actually needs the client instead
+    of being paid by every process that imports this package.
+    """
+    import inngest
+
+    return inngest.Inngest(
+        app_id="compliance-ingestion",
+        logger=logging.getLogger("inngest"),
+    )
+
+
+def __getattr__(name: str):
+    # Keep `from ingestion_functions.client import inngest_client` working
+    # without importing the SDK at module import time.
+    if name == "inngest_client":
+        return get_inngest_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
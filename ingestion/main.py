@@ -5,6 +5,8 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 import inngest.fast_api
 from ingestion_functions.client import inngest_client
@@ -38,9 +40,13 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Compliance Document Ingestion API",
     description="Enterprise-grade compliance document ingestion using Inngest workflows",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Compress large document payloads; parsed-content responses run to MBs
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -75,10 +81,27 @@ inngest.fast_api.serve(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "main:app",
-        host="127.0.0.1",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+
+    if os.environ.get("API_RELOAD", "").lower() in ("1", "true", "yes"):
+        # Dev mode: hot reload, single worker.
+        uvicorn.run(
+            "main:app",
+            host="127.0.0.1",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        # loop/http "auto" selects uvloop and httptools when installed
+        # (uvicorn[standard]) and falls back to asyncio/h11 elsewhere.
+        uvicorn.run(
+            "main:app",
+            host="127.0.0.1",
+            port=8000,
+            loop="auto",
+            http="auto",
+            workers=os.cpu_count(),
+            limit_concurrency=1000,
+            timeout_keep_alive=30,
+            log_level="info"
+        )
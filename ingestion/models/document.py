@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 
 class DocumentStatus(str, Enum):
@@ -51,8 +51,16 @@ class DocumentMetadata(BaseModel):
     parse_quality_score: Optional[float] = None
     extraction_method: Optional[str] = None
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "DocumentMetadata":
+        """Build metadata from already-validated internal data.
+
+        Skips field validation via model_construct; see
+        IngestionJob.from_trusted for the trust invariant.
+        """
+        return cls.model_construct(**data)
 
 
 class DocumentContent(BaseModel):
@@ -88,24 +96,35 @@ class Document(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_encoders={
             Path: str,
             datetime: lambda v: v.isoformat(),
             UUID: str,
-        }
+        },
+    )
     
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Document":
+        """Build a document from already-validated internal data.
+
+        Uses model_construct to skip field validation. Only safe for data
+        this service produced itself (e.g. a prior workflow step's output);
+        external input must go through normal validation.
+        """
+        return cls.model_construct(**data)
+
     def add_log(self, message: str) -> None:
         """Add a processing log entry."""
-        self.processing_logs.append(f"{datetime.utcnow().isoformat()}: {message}")
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.processing_logs.append(f"{now.isoformat()}: {message}")
+        self.updated_at = now
     
     def update_status(self, status: DocumentStatus, error: Optional[str] = None) -> None:
         """Update document status."""
         self.status = status
         self.error_message = error
-        self.updated_at = datetime.utcnow()
         
         status_msg = f"Status changed to {status.value}"
         if error:
@@ -5,7 +5,9 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobStatus(str, Enum):
@@ -68,33 +70,46 @@ class IngestionJob(BaseModel):
     inngest_event_id: Optional[str] = None
     inngest_run_id: Optional[str] = None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_encoders={
             datetime: lambda v: v.isoformat(),
             UUID: str,
-        }
+        },
+    )
     
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "IngestionJob":
+        """Build a job from already-validated internal data.
+
+        Uses model_construct to skip field validation. Only safe for data
+        this service produced itself (e.g. a prior workflow step's output);
+        external input must go through normal validation.
+        """
+        return cls.model_construct(**data)
+
     def add_log(self, message: str) -> None:
         """Add execution log entry."""
-        self.execution_logs.append(f"{datetime.utcnow().isoformat()}: {message}")
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.execution_logs.append(f"{now.isoformat()}: {message}")
+        self.updated_at = now
     
     def update_status(self, status: JobStatus, error: Optional[str] = None) -> None:
         """Update job status."""
+        now = datetime.utcnow()
         self.status = status
         self.error_message = error
-        self.updated_at = datetime.utcnow()
         
         if status == JobStatus.RUNNING and self.started_at is None:
-            self.started_at = datetime.utcnow()
+            self.started_at = now
         elif status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-            self.completed_at = datetime.utcnow()
+            self.completed_at = now
         
         status_msg = f"Job status changed to {status.value}"
         if error:
             status_msg += f" - Error: {error}"
         self.add_log(status_msg)
+        self._invalidate_derived()
     
     def update_progress(self, completed: int, failed: int, skipped: int = 0) -> None:
         """Update job progress."""
@@ -102,15 +117,25 @@ class IngestionJob(BaseModel):
         self.failed_tasks = failed
         self.skipped_tasks = skipped
         self.updated_at = datetime.utcnow()
+        self._invalidate_derived()
     
-    @property
+    def _invalidate_derived(self) -> None:
+        """Drop cached derived values after a state change.
+
+        Task counters and status must be changed through update_status /
+        update_progress so these caches stay coherent.
+        """
+        self.__dict__.pop('progress_percentage', None)
+        self.__dict__.pop('is_complete', None)
+    
+    @cached_property
     def progress_percentage(self) -> float:
         """Calculate job progress percentage."""
         if self.total_tasks == 0:
             return 0.0
         return (self.completed_tasks + self.failed_tasks + self.skipped_tasks) / self.total_tasks * 100
     
-    @property
+    @cached_property
     def is_complete(self) -> bool:
         """Check if job is complete."""
         return self.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]
@@ -132,13 +157,23 @@ class TaskResult(BaseModel):
     success: bool = False
     error_message: Optional[str] = None
     artifacts: Dict[str, Any] = Field(default_factory=dict)
-    
-    class Config:
-        use_enum_values = True
-        json_encoders = {
+
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_encoders={
             datetime: lambda v: v.isoformat(),
             UUID: str,
-        }
+        },
+    )
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "TaskResult":
+        """Build a task result from already-validated internal data.
+
+        Skips field validation via model_construct; see
+        IngestionJob.from_trusted for the trust invariant.
+        """
+        return cls.model_construct(**data)
 
 
 class IngestionResult(BaseModel):
@@ -157,27 +192,40 @@ class IngestionResult(BaseModel):
     average_task_time: Optional[float] = None
     documents_per_minute: Optional[float] = None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_encoders={
             datetime: lambda v: v.isoformat(),
             UUID: str,
-        }
+        },
+    )
     
     def calculate_metrics(self) -> None:
-        """Calculate performance metrics."""
+        """Calculate summary statistics and performance metrics."""
+        # Single pass over task results tallying success/failure counts
+        # and task timings together, instead of one generator scan per
+        # statistic.
+        successful = 0
+        total_task_time = 0.0
+        timed_tasks = 0
+        for result in self.task_results:
+            if result.success:
+                successful += 1
+            if result.duration_seconds is not None:
+                total_task_time += result.duration_seconds
+                timed_tasks += 1
+
+        self.total_documents_processed = len(self.task_results)
+        self.successful_documents = successful
+        self.failed_documents = self.total_documents_processed - successful - self.skipped_documents
+
+        if timed_tasks:
+            self.average_task_time = total_task_time / timed_tasks
+
         if self.job.started_at and self.job.completed_at:
             self.total_execution_time = (
                 self.job.completed_at - self.job.started_at
             ).total_seconds()
-            
+
             if self.total_execution_time > 0:
-                self.documents_per_minute = self.total_documents_processed / (self.total_execution_time / 60)
-        
-        task_times = [
-            result.duration_seconds for result in self.task_results 
-            if result.duration_seconds is not None
-        ]
-        
-        if task_times:
-            self.average_task_time = sum(task_times) / len(task_times) 
\ No newline at end of file
+                self.documents_per_minute = self.total_documents_processed / (self.total_execution_time / 60) 
\ No newline at end of file
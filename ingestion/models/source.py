@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Union
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 
 class SourceType(str, Enum):
@@ -35,7 +35,10 @@ class SourceConfig(BaseModel):
     fetch_method: FetchMethod
     
     # URL Configuration
-    base_url: HttpUrl
+    # Stored as str: these URLs come from our own registry files, and
+    # Pydantic's HttpUrl re-parses and validates on every hydration.
+    # The cheap scheme check below runs at write time.
+    base_url: str
     endpoints: List[str] = Field(default_factory=list)
     
     # Authentication
@@ -72,12 +75,19 @@ class SourceConfig(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_encoders={
             datetime: lambda v: v.isoformat(),
             UUID: str,
-        }
+        },
+    )
+    
+    @validator('base_url')
+    def validate_base_url(cls, v: str) -> str:
+        if not v.startswith(('http://', 'https://')):
+            raise ValueError("base_url must be an http(s) URL")
+        return v
     
     @validator('schedule_cron')
     def validate_cron(cls, v: Optional[str]) -> Optional[str]:
@@ -100,22 +110,25 @@ class Source(BaseModel):
     total_documents_fetched: int = 0
     successful_fetches: int = 0
     failed_fetches: int = 0
+    total_fetch_time: float = 0.0
     average_fetch_time: Optional[float] = None
     
-    class Config:
-        use_enum_values = True
-        json_encoders = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_encoders={
             datetime: lambda v: v.isoformat(),
             UUID: str,
-        }
+        },
+    )
     
     def update_stats(self, success: bool, fetch_time: float) -> None:
         """Update fetch statistics."""
-        self.config.last_fetched = datetime.utcnow()
+        now = datetime.utcnow()
+        self.config.last_fetched = now
         
         if success:
             self.successful_fetches += 1
-            self.config.last_successful_fetch = datetime.utcnow()
+            self.config.last_successful_fetch = now
             self.config.consecutive_failures = 0
         else:
             self.failed_fetches += 1
@@ -123,13 +136,9 @@ class Source(BaseModel):
         
         self.total_documents_fetched += 1
         
-        # Update average fetch time
-        if self.average_fetch_time is None:
-            self.average_fetch_time = fetch_time
-        else:
-            self.average_fetch_time = (
-                (self.average_fetch_time * (self.total_documents_fetched - 1) + fetch_time)
-                / self.total_documents_fetched
-            )
+        # Update average fetch time from the running total; one add and
+        # one divide instead of reconstructing the previous sum.
+        self.total_fetch_time += fetch_time
+        self.average_fetch_time = self.total_fetch_time / self.total_documents_fetched
         
-        self.config.updated_at = datetime.utcnow() 
\ No newline at end of file
+        self.config.updated_at = now 
\ No newline at end of file
@@ -1,31 +1,40 @@
 """HTML parser implementation using strategy pattern."""
 
+import asyncio
+import functools
 import time
 from typing import Dict, List, Union
 
 from .base_parser import BaseParser, ParseResult
 from .strategies import (
     PlaywrightHTMLStrategy,
-    TrafilaturaHTMLStrategy, 
+    TrafilaturaHTMLStrategy,
     BeautifulSoupHTMLStrategy
 )
 
 
 class HTMLParser(BaseParser):
     """Parser for HTML documents using multiple strategies."""
-    
+
+    # Strategies are stateless between parses, so the priority-sorted list
+    # is built once per process and shared by all parser instances.
+    _shared_strategies = None
+
     def __init__(self):
         super().__init__()
-        
-        # Initialize all parsing strategies
-        self.strategies = [
-            PlaywrightHTMLStrategy(logger=self.logger),
-            TrafilaturaHTMLStrategy(logger=self.logger),
-            BeautifulSoupHTMLStrategy(logger=self.logger)
-        ]
-        
-        # Sort strategies by priority (highest first)
-        self.strategies.sort(key=lambda s: s.get_priority(), reverse=True)
+
+        cls = type(self)
+        if cls._shared_strategies is None:
+            strategies = [
+                PlaywrightHTMLStrategy(logger=self.logger),
+                TrafilaturaHTMLStrategy(logger=self.logger),
+                BeautifulSoupHTMLStrategy(logger=self.logger)
+            ]
+            # Sort strategies by priority (highest first)
+            strategies.sort(key=lambda s: s.get_priority(), reverse=True)
+            cls._shared_strategies = strategies
+
+        self.strategies = cls._shared_strategies
     
     def can_parse(self, content_type: str, file_extension: str) -> bool:
         """Check if this parser can handle HTML files."""
@@ -36,57 +45,105 @@ class HTMLParser(BaseParser):
     
     async def parse(self, content: Union[bytes, str], **kwargs) -> ParseResult:
         """Parse HTML content using the best available strategy."""
-        start_time = time.time()
-        
-        if isinstance(content, bytes):
-            content = content.decode('utf-8', errors='ignore')
-        
+        start_time = time.perf_counter()
+
+        # Bytes pass through untouched: the strategies' parsers (lxml,
+        # bs4, trafilatura) all accept raw bytes and sniff the declared
+        # encoding themselves, which beats a blind lossy UTF-8 decode
+        # and skips allocating a second full-document string.
         url = kwargs.get('url')
-        
-        # Try each strategy in priority order
-        for strategy in self.strategies:
-            if strategy.can_handle(content, url):
-                self.logger.info(f"Trying strategy: {strategy.__class__.__name__}")
-                
+
+        # Race all applicable strategies instead of trying them serially;
+        # one slow strategy no longer adds its full latency in front of
+        # the others. The first result with acceptable quality wins and
+        # the losers are cancelled.
+        tasks = {
+            asyncio.create_task(strategy.parse(content, **kwargs)): strategy
+            for strategy in self.strategies
+            if strategy.can_handle(content, url)
+        }
+
+        best_result = None
+        best_quality = -1.0
+
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                strategy = tasks[task]
                 try:
-                    result = await strategy.parse(content, **kwargs)
-                    
-                    if result.success and result.content:
-                        # Calculate quality score for the result
-                        quality_score = self._calculate_quality_score(
-                            result.content.raw_text, 
-                            "html_parsing"
-                        )
-                        
-                        # If quality is acceptable or this is our last strategy, use it
-                        if quality_score >= 0.6 or strategy == self.strategies[-1]:
-                            result.quality_score = quality_score
-                            result.parse_time = time.time() - start_time
-                            
-                            self.logger.info(
-                                f"HTML parsing successful with {strategy.__class__.__name__}",
-                                quality_score=quality_score,
-                                content_length=len(result.content.raw_text)
-                            )
-                            
-                            return result
-                        else:
-                            self.logger.info(
-                                f"Quality too low ({quality_score:.2f}) with {strategy.__class__.__name__}, trying next strategy"
-                            )
-                            continue
-                    
+                    result = task.result()
                 except Exception as e:
                     self.logger.warning(
                         f"Strategy {strategy.__class__.__name__} failed: {str(e)}"
                     )
                     continue
-        
+
+                if not (result.success and result.content):
+                    continue
+
+                raw_text = result.content.raw_text
+
+                # Cheap pre-check: clearly thin output can never reach
+                # the quality bar, so don't pay for the O(n) scoring
+                # pass on it. Keep it only as a last-resort fallback.
+                if len(raw_text) < 200 or raw_text.count(' ') < 30:
+                    self.logger.info(
+                        f"Thin output from {strategy.__class__.__name__}, awaiting other strategies"
+                    )
+                    if best_result is None:
+                        best_result = result
+                        best_quality = 0.0
+                    continue
+
+                # Calculate quality score for the result
+                quality_score = self._calculate_quality_score(
+                    raw_text,
+                    "html_parsing"
+                )
+
+                if quality_score >= 0.6:
+                    for leftover in pending:
+                        leftover.cancel()
+
+                    result.quality_score = quality_score
+                    result.parse_time = time.perf_counter() - start_time
+
+                    self.logger.info(
+                        f"HTML parsing successful with {strategy.__class__.__name__}",
+                        quality_score=quality_score,
+                        content_length=len(result.content.raw_text)
+                    )
+
+                    return result
+
+                self.logger.info(
+                    f"Quality too low ({quality_score:.2f}) with {strategy.__class__.__name__}, awaiting other strategies"
+                )
+                if quality_score > best_quality:
+                    best_result = result
+                    best_quality = quality_score
+
+        # No strategy reached the quality bar; fall back to the best result
+        if best_result is not None:
+            best_result.quality_score = best_quality
+            best_result.parse_time = time.perf_counter() - start_time
+            return best_result
+
         # If all strategies failed
         self.logger.error("All HTML parsing strategies failed")
         return ParseResult(
             success=False,
             error_message="Failed to parse HTML with all available strategies",
-            parse_time=time.time() - start_time,
+            parse_time=time.perf_counter() - start_time,
             extraction_method="html_failed"
         )
+
+
+@functools.lru_cache(maxsize=1)
+def get_html_parser() -> HTMLParser:
+    """Get the shared HTMLParser instance."""
+    return HTMLParser()
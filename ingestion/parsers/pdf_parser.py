@@ -1,5 +1,6 @@
 """PDF parser implementation using PyMuPDF and pdfplumber."""
 
+import asyncio
 import time
 from io import BytesIO
 from typing import Dict, List, Union
@@ -11,6 +12,10 @@ from PIL import Image
 from .base_parser import BaseParser, ParseResult
 from models.document import DocumentContent
 
+# Plain-text extraction flags plus dehyphenation, so line-break hyphens
+# are rejoined by MuPDF instead of surviving into the cleaned text.
+_PYMUPDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT | fitz.TEXT_DEHYPHENATE
+
 
 class PDFParser(BaseParser):
     """Parser for PDF documents."""
@@ -86,76 +91,11 @@ class PDFParser(BaseParser):
     async def _parse_with_pymupdf(self, content: bytes) -> ParseResult:
         """Parse PDF using PyMuPDF."""
         try:
-            doc = fitz.open(stream=content, filetype="pdf")
-            
-            text_content = ""
-            sections = []
-            images = []
-            tables = []
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Extract text
-                page_text = page.get_text()
-                text_content += page_text + "\n"
-                
-                # Extract images (metadata only for now)
-                image_list = page.get_images()
-                for img_index, img in enumerate(image_list):
-                    images.append({
-                        "page": page_num + 1,
-                        "index": img_index,
-                        "width": img[2] if len(img) > 2 else None,
-                        "height": img[3] if len(img) > 3 else None
-                    })
-                
-                # Extract tables (basic detection)
-                tables_on_page = page.find_tables()
-                for table_index, table in enumerate(tables_on_page):
-                    try:
-                        table_data = table.extract()
-                        tables.append({
-                            "page": page_num + 1,
-                            "index": table_index,
-                            "rows": len(table_data) if table_data else 0,
-                            "cols": len(table_data[0]) if table_data and table_data[0] else 0,
-                            "data": table_data[:5] if table_data else []  # First 5 rows only
-                        })
-                    except Exception as e:
-                        self.logger.warning(
-                            "Failed to extract table",
-                            page=page_num + 1,
-                            table_index=table_index,
-                            error=str(e)
-                        )
-            
-            doc.close()
-            
-            # Clean and structure the text
-            cleaned_text = self._clean_text(text_content)
-            sections = self._extract_sections(cleaned_text)
-            links = self._extract_links(cleaned_text)
-            
-            content_obj = DocumentContent(
-                raw_text=cleaned_text,
-                structured_sections=sections,
-                tables=tables,
-                images=images,
-                links=links
-            )
-            
-            return ParseResult(
-                success=True,
-                content=content_obj,
-                extraction_method="pymupdf",
-                metadata={
-                    "total_pages": len(doc) if 'doc' in locals() else 0,
-                    "total_images": len(images),
-                    "total_tables": len(tables)
-                }
-            )
-        
+            # MuPDF objects must not be shared across threads, so the
+            # page loop can't fan out; instead the whole synchronous
+            # extraction runs on one worker thread, keeping the event
+            # loop free and letting concurrent documents overlap.
+            return await asyncio.to_thread(self._extract_with_pymupdf, content)
         except Exception as e:
             self.logger.error("PyMuPDF parsing failed", error=str(e))
             return ParseResult(
@@ -163,20 +103,96 @@ class PDFParser(BaseParser):
                 error_message=f"PyMuPDF parsing failed: {str(e)}",
                 extraction_method="pymupdf"
             )
-    
+
+    def _extract_with_pymupdf(self, content: bytes) -> ParseResult:
+        """Synchronous PyMuPDF extraction; runs on a worker thread."""
+        doc = fitz.open(stream=content, filetype="pdf")
+        total_pages = len(doc)
+
+        # Page texts are buffered and joined once; += on a string
+        # reallocates the full accumulator per page.
+        text_parts = []
+        sections = []
+        images = []
+        tables = []
+
+        for page_num in range(total_pages):
+            page = doc[page_num]
+
+            # Extract text
+            text_parts.append(page.get_text("text", flags=_PYMUPDF_TEXT_FLAGS))
+            
+            # Extract images (metadata only for now)
+            image_list = page.get_images()
+            for img_index, img in enumerate(image_list):
+                images.append({
+                    "page": page_num + 1,
+                    "index": img_index,
+                    "width": img[2] if len(img) > 2 else None,
+                    "height": img[3] if len(img) > 3 else None
+                })
+            
+            # Extract tables (basic detection)
+            tables_on_page = page.find_tables()
+            for table_index, table in enumerate(tables_on_page):
+                try:
+                    table_data = table.extract()
+                    tables.append({
+                        "page": page_num + 1,
+                        "index": table_index,
+                        "rows": len(table_data) if table_data else 0,
+                        "cols": len(table_data[0]) if table_data and table_data[0] else 0,
+                        "data": table_data[:5] if table_data else []  # First 5 rows only
+                    })
+                except Exception as e:
+                    self.logger.warning(
+                        "Failed to extract table",
+                        page=page_num + 1,
+                        table_index=table_index,
+                        error=str(e)
+                    )
+        
+        doc.close()
+
+        # Clean and structure the text. MuPDF text mode already
+        # normalizes whitespace, so skip the regex collapse passes.
+        text_parts.append("")  # Preserve the trailing newline
+        cleaned_text = self._clean_text("\n".join(text_parts), already_clean=True)
+        sections = self._extract_sections(cleaned_text)
+        links = self._extract_links(cleaned_text)
+        
+        content_obj = DocumentContent(
+            raw_text=cleaned_text,
+            structured_sections=sections,
+            tables=tables,
+            images=images,
+            links=links
+        )
+        
+        return ParseResult(
+            success=True,
+            content=content_obj,
+            extraction_method="pymupdf",
+            metadata={
+                "total_pages": total_pages,
+                "total_images": len(images),
+                "total_tables": len(tables)
+            }
+        )
+
     async def _parse_with_pdfplumber(self, content: bytes) -> ParseResult:
         """Parse PDF using pdfplumber."""
         try:
             with pdfplumber.open(BytesIO(content)) as pdf:
-                text_content = ""
+                text_parts = []
                 tables = []
                 images = []
-                
+
                 for page_num, page in enumerate(pdf.pages):
                     # Extract text
                     page_text = page.extract_text()
                     if page_text:
-                        text_content += page_text + "\n"
+                        text_parts.append(page_text)
                     
                     # Extract tables
                     page_tables = page.extract_tables()
@@ -201,7 +217,8 @@ class PDFParser(BaseParser):
                             })
                 
                 # Clean and structure the text
-                cleaned_text = self._clean_text(text_content)
+                text_parts.append("")  # Preserve the trailing newline
+                cleaned_text = self._clean_text("\n".join(text_parts))
                 sections = self._extract_sections(cleaned_text)
                 links = self._extract_links(cleaned_text)
                 
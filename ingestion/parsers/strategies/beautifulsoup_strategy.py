@@ -9,6 +9,15 @@ from .base_html_strategy import BaseHTMLStrategy
 from parsers.base_parser import ParseResult
 from models.document import DocumentContent
 
+# Prefer the C-backed lxml tree builder; html.parser is pure Python and
+# dominates CPU time on large pages. Probed once at import so the
+# per-parse constructor doesn't pay for a failed feature lookup.
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
 
 class BeautifulSoupHTMLStrategy(BaseHTMLStrategy):
     """HTML parsing strategy using BeautifulSoup for detailed structure extraction."""
@@ -22,27 +31,31 @@ class BeautifulSoupHTMLStrategy(BaseHTMLStrategy):
         return 50
     
     async def parse(self, content: Union[bytes, str], **kwargs) -> ParseResult:
-        """Parse HTML using BeautifulSoup."""
-        if isinstance(content, bytes):
-            content = content.decode('utf-8', errors='ignore')
-        
+        """Parse HTML using BeautifulSoup.
+
+        Bytes are handed to the parser as-is; both backends sniff the
+        document's declared encoding, which is more accurate than a
+        lossy UTF-8 decode and avoids copying the whole page first.
+        """
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.extract()
-            
-            # Extract text
-            text_content = soup.get_text()
-            
-            # Extract structured data
-            tables = self._extract_tables_from_soup(soup)
-            links = self._extract_links_from_soup(soup)
-            images = self._extract_images_from_soup(soup)
-            
-            # Clean and structure the text
-            cleaned_text = self._clean_text(text_content)
+            soup = BeautifulSoup(content, _SOUP_PARSER)
+            
+            # Remove script and style elements. decompose() destroys
+            # the subtree and releases it immediately; extract() kept
+            # every removed subtree alive as a detached tree for the
+            # rest of the parse.
+            for element in soup(["script", "style", "nav", "header", "footer"]):
+                element.decompose()
+            
+            # Extract text; separator + strip emit stripped, non-empty
+            # segments during the same C-level walk, which is exactly
+            # what the manual _clean_text pass did afterwards.
+            cleaned_text = soup.get_text(separator='\n', strip=True)
+
+            # Extract structured data in a single tree walk
+            tables, links, images, meta_info = self._extract_structured_data(soup)
+
+            # Structure the text
             sections = self._extract_sections(cleaned_text)
             
             content_obj = DocumentContent(
@@ -53,17 +66,11 @@ class BeautifulSoupHTMLStrategy(BaseHTMLStrategy):
                 links=links
             )
             
-            # Extract metadata from HTML
-            title = soup.find('title')
-            meta_description = soup.find('meta', attrs={'name': 'description'})
-            meta_author = soup.find('meta', attrs={'name': 'author'})
-            meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-            
             extraction_metadata = {
-                "title": title.string if title else None,
-                "description": meta_description.get('content') if meta_description else None,
-                "author": meta_author.get('content') if meta_author else None,
-                "keywords": meta_keywords.get('content') if meta_keywords else None,
+                "title": meta_info.get('title'),
+                "description": meta_info.get('description'),
+                "author": meta_info.get('author'),
+                "keywords": meta_info.get('keywords'),
                 "total_tables": len(tables),
                 "total_images": len(images),
                 "total_links": len(links),
@@ -87,86 +94,120 @@ class BeautifulSoupHTMLStrategy(BaseHTMLStrategy):
                 extraction_method="beautifulsoup"
             )
     
-    def _extract_tables_from_soup(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract tables from BeautifulSoup object."""
-        tables = []
-        
-        for table_index, table in enumerate(soup.find_all('table')):
-            rows = []
-            
-            # Extract headers if present
-            headers = []
-            header_row = table.find('tr')
-            if header_row:
-                for th in header_row.find_all(['th', 'td']):
-                    headers.append(th.get_text(strip=True))
-            
-            # Extract all rows
-            for row in table.find_all('tr'):
-                cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
-                if cells:  # Only add non-empty rows
-                    rows.append(cells)
-            
-            if rows:
-                table_data = {
-                    "index": table_index,
-                    "rows": len(rows),
-                    "cols": max(len(row) for row in rows) if rows else 0,
-                    "headers": headers if headers else None,
-                    "data": rows[:10]  # First 10 rows only to avoid massive data
-                }
-                
-                # Add table summary
-                if len(rows) > 10:
-                    table_data["summary"] = f"Table with {len(rows)} rows (showing first 10)"
-                
-                tables.append(table_data)
-        
-        return tables
-    
-    def _extract_links_from_soup(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """Extract links from BeautifulSoup object."""
-        links = []
-        
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            text = link.get_text(strip=True)
-            
-            # Skip empty links or javascript
-            if not href or href.startswith('javascript:') or not text:
-                continue
-            
-            link_type = "internal" if href.startswith('#') or href.startswith('/') else "external"
-            
-            links.append({
-                "url": href,
-                "text": text[:200],  # Limit text length
-                "type": link_type,
-                "title": link.get('title', ''),
-                "target": link.get('target', '')
-            })
-        
-        return links[:100]  # Limit to first 100 links
-    
-    def _extract_images_from_soup(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
-        """Extract images from BeautifulSoup object."""
-        images = []
-        
-        for img_index, img in enumerate(soup.find_all('img')):
-            src = img.get('src', '')
-            
-            # Skip empty src or data URIs (too long)
-            if not src or src.startswith('data:'):
+    def _extract_structured_data(
+        self, soup: BeautifulSoup
+    ) -> tuple:
+        """Collect tables, links, images, and page metadata in one walk.
+
+        find_all per tag walks the whole DOM each time; dispatching on
+        tag name during a single soup.descendants pass collects
+        everything in one traversal, with the result caps enforced as
+        the walk runs so link-heavy pages stop paying for discarded
+        rows. The title and meta tags ride along in the same pass
+        instead of four extra soup.find traversals.
+        """
+        tables: List[Dict] = []
+        links: List[Dict[str, str]] = []
+        images: List[Dict[str, str]] = []
+        meta_info: Dict[str, Optional[str]] = {}
+
+        for element in soup.descendants:
+            name = getattr(element, 'name', None)
+            if name is None:
                 continue
-            
-            images.append({
-                "index": img_index,
-                "src": src,
-                "alt": img.get('alt', ''),
-                "title": img.get('title', ''),
-                "width": img.get('width'),
-                "height": img.get('height'),
-                "class": ' '.join(img.get('class', [])) if img.get('class') else ''
-            })
-        
-        return images[:50]  # Limit to first 50 images 
\ No newline at end of file
+
+            if name == 'table':
+                table_data = self._extract_table(element, len(tables))
+                if table_data:
+                    tables.append(table_data)
+
+            elif name == 'a' and len(links) < 100:
+                href = element.get('href')
+                text = element.get_text(strip=True)
+
+                # Skip empty links or javascript
+                if not href or href.startswith('javascript:') or not text:
+                    continue
+
+                link_type = "internal" if href.startswith('#') or href.startswith('/') else "external"
+
+                links.append({
+                    "url": href,
+                    "text": text[:200],  # Limit text length
+                    "type": link_type,
+                    "title": element.get('title', ''),
+                    "target": element.get('target', '')
+                })
+
+            elif name == 'img' and len(images) < 50:
+                src = element.get('src', '')
+
+                # Skip empty src or data URIs (too long)
+                if not src or src.startswith('data:'):
+                    continue
+
+                images.append({
+                    "index": len(images),
+                    "src": src,
+                    "alt": element.get('alt', ''),
+                    "title": element.get('title', ''),
+                    "width": element.get('width'),
+                    "height": element.get('height'),
+                    "class": ' '.join(element.get('class', [])) if element.get('class') else ''
+                })
+
+            elif name == 'title':
+                if 'title' not in meta_info:
+                    meta_info['title'] = element.string
+
+            elif name == 'meta':
+                meta_name = element.get('name')
+                if meta_name in ('description', 'author', 'keywords') and meta_name not in meta_info:
+                    meta_info[meta_name] = element.get('content')
+
+        return tables, links, images, meta_info
+
+    def _extract_table(self, table, table_index: int) -> Optional[Dict]:
+        """Extract a single table element into the summary dict format.
+
+        Only the rows that end up in the result are materialized:
+        find_all stops traversing after one row past the cap (to detect
+        truncation) instead of building cell text for every row of huge
+        data tables just to slice ten of them.
+        """
+        # One extra row so truncation can be flagged without counting
+        # the whole table.
+        tr_elements = table.find_all('tr', limit=11)
+        truncated = len(tr_elements) > 10
+
+        headers: List[str] = []
+        rows = []
+        max_cols = 0
+        for row_index, row in enumerate(tr_elements[:10]):
+            cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+            if row_index == 0:
+                # The first row doubles as the header; reuse this cell
+                # pass instead of re-walking the row a second time.
+                headers = cells
+            if cells:  # Only add non-empty rows
+                rows.append(cells)
+                if len(cells) > max_cols:
+                    max_cols = len(cells)
+
+        if not rows:
+            return None
+
+        table_data = {
+            "index": table_index,
+            "rows": len(rows),
+            "cols": max_cols,
+            "headers": headers if headers else None,
+            "data": rows
+        }
+
+        # Flag tables that have more rows than were kept
+        if truncated:
+            table_data["truncated"] = True
+            table_data["summary"] = "Table truncated to first 10 rows"
+
+        return table_data
\ No newline at end of file
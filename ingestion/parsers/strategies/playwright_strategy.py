@@ -1,16 +1,54 @@
 """Playwright HTML parsing strategy for dynamic content."""
 
+import asyncio
+import re
 import time
 from typing import Union, Optional
+from urllib.parse import urlsplit
 
 from .base_html_strategy import BaseHTMLStrategy
 from parsers.base_parser import ParseResult
 from models.document import DocumentContent
 
+# All policy indicators in one alternation so the page is scanned once
+# instead of once per indicator (each of which walked the full text).
+_POLICY_INDICATOR_RE = re.compile(
+    '|'.join((
+        'executive order', 'section', 'whereas', 'shall', 'authority vested',
+        'hereby ordered', 'artificial intelligence', 'compliance', 'regulation',
+        'pursuant to', 'administration', 'federal', 'policy', 'implementation',
+    )),
+    re.IGNORECASE,
+)
+
 
 class PlaywrightHTMLStrategy(BaseHTMLStrategy):
     """HTML parsing strategy using Playwright for dynamic content."""
-    
+
+    # Browser startup costs hundreds of ms, so one headless instance is
+    # shared process-wide; each parse gets its own BrowserContext for
+    # isolation. The lock serializes the one-time launch.
+    _playwright = None
+    _browser = None
+    _browser_lock = asyncio.Lock()
+
+    @classmethod
+    async def _get_browser(cls):
+        """Launch (or relaunch) the shared headless browser lazily."""
+        if cls._browser is None or not cls._browser.is_connected():
+            async with cls._browser_lock:
+                if cls._browser is None or not cls._browser.is_connected():
+                    from playwright.async_api import async_playwright
+
+                    if cls._playwright is None:
+                        cls._playwright = await async_playwright().start()
+                    cls._browser = await cls._playwright.chromium.launch(headless=True)
+        return cls._browser
+
+    # Primary content selector per site, used as the readiness signal
+    # after navigation; the generic entry ORs the common content roots.
+    _GENERIC_SELECTOR = 'main, article, [role="main"], .content, #content'
+
     def __init__(self, logger=None):
         super().__init__(logger)
         self.site_extractors = {
@@ -19,6 +57,12 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
             'edpb.europa.eu': self._extract_edpb_content,
             'fpf.org': self._extract_fpf_content,
         }
+        self.site_selectors = {
+            'whitehouse.gov': 'section.body-content, .body-content',
+            'eur-lex.europa.eu': '#document, .eli-document',
+            'edpb.europa.eu': '.field-name-body, .content',
+            'fpf.org': '.entry-content, .post-content',
+        }
     
     def can_handle(self, content: Union[bytes, str], url: Optional[str] = None) -> bool:
         """Playwright is best for dynamic content when URL is available."""
@@ -39,56 +83,60 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
             )
         
         try:
-            from playwright.async_api import async_playwright
-            
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-                
-                # Navigate to the page
-                await page.goto(url, wait_until='networkidle')
-                
-                # Wait for dynamic content
-                await page.wait_for_timeout(2000)
-                
+            browser = await self._get_browser()
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+
+                # Navigate, then wait for the site's primary content
+                # selector instead of network idle plus a fixed 2 s
+                # sleep; ready pages proceed as soon as content exists.
+                await page.goto(url, wait_until='domcontentloaded')
+                try:
+                    await page.wait_for_selector(self._primary_selector(url), timeout=5000)
+                except Exception:
+                    # Selector never showed up; give scripts one short
+                    # settle window before extracting what's there.
+                    await page.wait_for_timeout(1000)
+
                 # Extract content using site-specific logic
                 text_content, metadata = await self._extract_content_by_site(page, url)
-                
-                await browser.close()
-                
-                if not text_content or len(text_content.strip()) < 100:
-                    return ParseResult(
-                        success=False,
-                        error_message="No substantial content extracted by Playwright",
-                        extraction_method="playwright"
-                    )
-                
-                # Clean and structure the text
-                cleaned_text = self._clean_text(text_content)
-                sections = self._extract_sections(cleaned_text)
-                
-                content_obj = DocumentContent(
-                    raw_text=cleaned_text,
-                    structured_sections=sections,
-                    tables=[],
-                    images=[],
-                    links=[]
-                )
-                
-                extraction_metadata = {
-                    **metadata,
-                    "url": url,
-                    "extraction_method": "playwright",
-                    "content_length": len(cleaned_text)
-                }
-                
+            finally:
+                await context.close()
+
+            if not text_content or len(text_content.strip()) < 100:
                 return ParseResult(
-                    success=True,
-                    content=content_obj,
-                    extraction_method="playwright",
-                    metadata=extraction_metadata
+                    success=False,
+                    error_message="No substantial content extracted by Playwright",
+                    extraction_method="playwright"
                 )
-                
+
+            # Clean and structure the text
+            cleaned_text = self._clean_text(text_content)
+            sections = self._extract_sections(cleaned_text)
+
+            content_obj = DocumentContent(
+                raw_text=cleaned_text,
+                structured_sections=sections,
+                tables=[],
+                images=[],
+                links=[]
+            )
+
+            extraction_metadata = {
+                **metadata,
+                "url": url,
+                "extraction_method": "playwright",
+                "content_length": len(cleaned_text)
+            }
+
+            return ParseResult(
+                success=True,
+                content=content_obj,
+                extraction_method="playwright",
+                metadata=extraction_metadata
+            )
+
         except Exception as e:
             if self.logger:
                 self.logger.error("Playwright parsing failed", error=str(e))
@@ -98,16 +146,75 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
                 extraction_method="playwright"
             )
     
+    async def parse_many(self, urls: list, concurrency: int = 8) -> list:
+        """Parse a batch of URLs concurrently over the shared browser.
+
+        Each URL gets its own isolated context via parse(); the
+        semaphore bounds how many pages are open at once so a large
+        batch can't exhaust the browser. Results come back in input
+        order, failures included as unsuccessful ParseResults.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def parse_one(url: str) -> ParseResult:
+            async with semaphore:
+                return await self.parse(b"", url=url)
+
+        return list(await asyncio.gather(*(parse_one(url) for url in urls)))
+
+    def _site_key(self, url: str) -> Optional[str]:
+        """Resolve a URL to its registered site key, if any.
+
+        Parses the host once and walks up parent labels so subdomains
+        reach their registered site; this stays O(label count) as more
+        site extractors are added.
+        """
+        host = (urlsplit(url).hostname or '').lower()
+        while host:
+            if host in self.site_extractors:
+                return host
+            _, _, host = host.partition('.')
+        return None
+
+    def _primary_selector(self, url: str) -> str:
+        """Selector whose appearance signals the page content is ready."""
+        site = self._site_key(url)
+        if site is not None:
+            return self.site_selectors.get(site, self._GENERIC_SELECTOR)
+        return self._GENERIC_SELECTOR
+
     async def _extract_content_by_site(self, page, url: str) -> tuple[str, dict]:
         """Extract content using site-specific logic."""
-        # Determine site and use appropriate extractor
-        for domain, extractor in self.site_extractors.items():
-            if domain in url.lower():
-                return await extractor(page)
-        
+        site = self._site_key(url)
+        if site is not None:
+            return await self.site_extractors[site](page)
+
         # Default generic extraction
         return await self._extract_generic_content(page)
     
+    @staticmethod
+    async def _first_matching_text(page, selectors: list, min_length: int) -> str:
+        """Return the first selector's text that beats min_length.
+
+        The selector list is probed inside a single page.evaluate, so
+        one CDP round-trip replaces a query_selector + inner_text pair
+        per selector. Invalid selectors are skipped in-page, matching
+        the old per-selector try/except behavior.
+        """
+        return await page.evaluate(
+            '''([selectors, minLength]) => {
+                for (const selector of selectors) {
+                    let element;
+                    try { element = document.querySelector(selector); } catch (e) { continue; }
+                    if (element && element.innerText.length > minLength) {
+                        return element.innerText;
+                    }
+                }
+                return "";
+            }''',
+            [selectors, min_length],
+        )
+
     async def _extract_whitehouse_content(self, page) -> tuple[str, dict]:
         """Extract content from White House sites."""
         # Remove navigation and non-content elements first
@@ -141,19 +248,30 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
             'main'
         ]
         
+        # Collect every candidate over the length bar in one in-page
+        # pass, then apply the policy-content check Python-side.
+        candidates = await page.evaluate(
+            '''(selectors) => {
+                const results = [];
+                for (const selector of selectors) {
+                    let element;
+                    try { element = document.querySelector(selector); } catch (e) { continue; }
+                    if (element && element.innerText.length > 1000) {
+                        results.push(element.innerText);
+                    }
+                }
+                return results;
+            }''',
+            content_selectors,
+        )
+
         text_content = ""
-        for selector in content_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    content = await element.inner_text()
-                    # Check if this looks like actual policy content
-                    if len(content) > 1000 and self._is_policy_content(content):
-                        text_content = content
-                        break
-            except Exception:
-                continue
-        
+        for content in candidates:
+            # Check if this looks like actual policy content
+            if self._is_policy_content(content):
+                text_content = content
+                break
+
         # If no good content found, try filtered body
         if not text_content:
             text_content = await page.inner_text('body')
@@ -173,18 +291,8 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
             '.eli-main-content'
         ]
         
-        text_content = ""
-        for selector in content_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    content = await element.inner_text()
-                    if len(content) > 1000:
-                        text_content = content
-                        break
-            except Exception:
-                continue
-        
+        text_content = await self._first_matching_text(page, content_selectors, 1000)
+
         title = await page.title()
         return text_content, {"title": title, "site": "eur-lex.europa.eu"}
     
@@ -198,18 +306,8 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
             '.page-content'
         ]
         
-        text_content = ""
-        for selector in content_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    content = await element.inner_text()
-                    if len(content) > 500:
-                        text_content = content
-                        break
-            except Exception:
-                continue
-        
+        text_content = await self._first_matching_text(page, content_selectors, 500)
+
         title = await page.title()
         return text_content, {"title": title, "site": "edpb.europa.eu"}
     
@@ -223,18 +321,8 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
             '.main-content'
         ]
         
-        text_content = ""
-        for selector in content_selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    content = await element.inner_text()
-                    if len(content) > 300:
-                        text_content = content
-                        break
-            except Exception:
-                continue
-        
+        text_content = await self._first_matching_text(page, content_selectors, 300)
+
         title = await page.title()
         return text_content, {"title": title, "site": "fpf.org"}
     
@@ -276,12 +364,16 @@ class PlaywrightHTMLStrategy(BaseHTMLStrategy):
         return text_content, {"title": title, "site": "generic"}
     
     def _is_policy_content(self, content: str) -> bool:
-        """Check if content looks like policy/compliance content."""
-        policy_indicators = [
-            'executive order', 'section', 'whereas', 'shall', 'authority vested',
-            'hereby ordered', 'artificial intelligence', 'compliance', 'regulation',
-            'pursuant to', 'administration', 'federal', 'policy', 'implementation'
-        ]
-        
-        content_lower = content.lower()
-        return sum(1 for indicator in policy_indicators if indicator in content_lower) >= 3 
\ No newline at end of file
+        """Check if content looks like policy/compliance content.
+
+        One case-insensitive scan over the content, stopping as soon as
+        three distinct indicators have been seen; the old version
+        lowercased the whole page and substring-scanned it once per
+        indicator.
+        """
+        found = set()
+        for match in _POLICY_INDICATOR_RE.finditer(content):
+            found.add(match.group().lower())
+            if len(found) >= 3:
+                return True
+        return False
\ No newline at end of file
@@ -1,10 +1,20 @@
 """Content processing and chunking for compliance documents."""
 
-import json
+import array
 import os
 import datetime
+import re
 from typing import Dict, List, Any
 
+import orjson
+
+from services.content_quality_service import ContentQualityService
+
+# One sentence (text up to terminal punctuation plus trailing space)
+# per match; iterating matches streams sentences without materializing
+# the full split list up front.
+_SENTENCE_RE = re.compile(r'[^.!?]+[.!?]+\s*')
+
 
 class ContentProcessor:
     """Processes and structures extracted content into chunks."""
@@ -28,27 +38,38 @@ class ContentProcessor:
         # Clean and chunk the text content
         cleaned_text = self._clean_text(text_content)
         chunks = self._create_chunks(cleaned_text, doc_id)
-        
+
+        # One timestamp covers the whole processing pass
+        now_iso = datetime.datetime.now().isoformat()
+
+        # One pass over the chunks serves the parsed doc, the metadata
+        # and the result summary below
+        total_words = sum(chunk["word_count"] for chunk in chunks)
+        total_chars = sum(chunk["char_count"] for chunk in chunks)
+
         # Create parsed document structure
         parsed_doc = self._create_parsed_document(
-            source_config, url, doc_id, chunks, raw_file_path, content_type
+            source_config, url, doc_id, chunks, raw_file_path, content_type, now_iso,
+            total_words, total_chars
         )
-        
-        # Save parsed document
+
+        # Save parsed document, plus the chunk sidecar used for
+        # pagination without re-parsing the whole document
         self._save_parsed_document(parsed_doc, parsed_file_path)
-        
+        self._save_chunk_sidecar(chunks, parsed_file_path)
+
         # Create and save metadata
         metadata = self._create_metadata(
-            parsed_doc, source_config, url, raw_file_path, 
-            parsed_file_path, content_type, chunks
+            parsed_doc, source_config, url, raw_file_path,
+            parsed_file_path, content_type, chunks, now_iso, total_words
         )
         self._save_metadata(metadata, metadata_file_path)
-        
+
         return {
             "url": url,
             "document_id": parsed_doc["document_id"],
             "chunks": len(chunks),
-            "words": sum(chunk["word_count"] for chunk in chunks),
+            "words": total_words,
             "status": "success"
         }
     
@@ -57,38 +78,67 @@ class ContentProcessor:
         return ' '.join(text_content.split())
     
     def _create_chunks(self, cleaned_text: str, doc_id: str) -> List[Dict[str, Any]]:
-        """Create content chunks from cleaned text."""
-        sentences = cleaned_text.split('. ')
+        """Create content chunks from cleaned text.
+
+        Sentences stream out of one regex pass and accumulate in a list
+        alongside a running word count, so each character is copied
+        once into its chunk. The old version re-split and re-joined the
+        growing chunk per sentence, which was quadratic in chunk size.
+        """
         chunks = []
-        current_chunk = ""
-        chunk_index = 0
-        
-        for sentence in sentences:
-            test_chunk = current_chunk + sentence + ". "
-            
-            if len(test_chunk.split()) > self.max_words_per_chunk and current_chunk:
-                chunks.append(self._create_chunk(current_chunk, doc_id, chunk_index))
-                current_chunk = sentence + ". "
-                chunk_index += 1
-            else:
-                current_chunk = test_chunk
-        
-        # Add final chunk
-        if current_chunk.strip():
-            chunks.append(self._create_chunk(current_chunk, doc_id, chunk_index))
-        
+        current_parts: List[str] = []
+        current_words = 0
+        last_end = 0
+
+        def flush() -> None:
+            nonlocal current_words
+            chunks.append(self._create_chunk(''.join(current_parts), doc_id, len(chunks)))
+            current_parts.clear()
+            current_words = 0
+
+        for match in _SENTENCE_RE.finditer(cleaned_text):
+            sentence = match.group()
+            last_end = match.end()
+            sentence_words = len(sentence.split())
+
+            if current_parts and current_words + sentence_words > self.max_words_per_chunk:
+                flush()
+            current_parts.append(sentence)
+            current_words += sentence_words
+
+        # Trailing text without terminal punctuation
+        tail = cleaned_text[last_end:]
+        if tail.strip():
+            tail_words = len(tail.split())
+            if current_parts and current_words + tail_words > self.max_words_per_chunk:
+                flush()
+            current_parts.append(tail)
+
+        if current_parts and ''.join(current_parts).strip():
+            flush()
+
         return chunks
     
     def _create_chunk(self, content: str, doc_id: str, chunk_index: int) -> Dict[str, Any]:
-        """Create a single chunk object."""
+        """Create a single chunk object.
+
+        Quality is scored here, once at ingest, and persisted with the
+        chunk; the analyze/filter endpoints read the stored values
+        instead of re-running the indicator scans on every request.
+        """
         content = content.strip()
+        quality = ContentQualityService.analyze_content_quality(content)
         return {
             "chunk_id": f"{doc_id}_chunk_{chunk_index:03d}",
             "content": content,
             "chunk_index": chunk_index,
             "chunk_type": "paragraph",
             "word_count": len(content.split()),
-            "char_count": len(content)
+            "char_count": len(content),
+            "quality_score": quality["quality_score"],
+            "compliance_terms": quality["compliance_terms"],
+            "sentences": quality["sentences"],
+            "is_likely_noise": quality["is_likely_noise"]
         }
     
     def _create_parsed_document(
@@ -98,7 +148,10 @@ class ContentProcessor:
         doc_id: str,
         chunks: List[Dict[str, Any]],
         raw_file_path: str,
-        content_type: str
+        content_type: str,
+        processed_at: str,
+        total_words: int,
+        total_chars: int
     ) -> Dict[str, Any]:
         """Create the parsed document structure."""
         return {
@@ -111,9 +164,9 @@ class ContentProcessor:
             "tags": source_config.get("tags", []),
             "content_chunks": chunks,
             "total_chunks": len(chunks),
-            "total_words": sum(chunk["word_count"] for chunk in chunks),
-            "total_characters": sum(chunk["char_count"] for chunk in chunks),
-            "processed_at": datetime.datetime.now().isoformat(),
+            "total_words": total_words,
+            "total_characters": total_chars,
+            "processed_at": processed_at,
             "raw_file_path": raw_file_path,
             "content_type": content_type
         }
@@ -126,9 +179,15 @@ class ContentProcessor:
         raw_file_path: str,
         parsed_file_path: str,
         content_type: str,
-        chunks: List[Dict[str, Any]]
+        chunks: List[Dict[str, Any]],
+        processing_timestamp: str,
+        total_words: int
     ) -> Dict[str, Any]:
         """Create metadata for the processed document."""
+        try:
+            file_size = os.stat(raw_file_path).st_size
+        except (FileNotFoundError, OSError):
+            file_size = 0
         return {
             "document_id": parsed_doc["document_id"],
             "source_name": source_config.get("name"),
@@ -136,20 +195,58 @@ class ContentProcessor:
             "raw_file_path": raw_file_path,
             "parsed_file_path": parsed_file_path,
             "content_type": content_type,
-            "file_size_bytes": os.path.getsize(raw_file_path) if os.path.exists(raw_file_path) else 0,
+            "file_size_bytes": file_size,
             "total_chunks": len(chunks),
-            "total_words": sum(chunk["word_count"] for chunk in chunks),
-            "processing_timestamp": datetime.datetime.now().isoformat(),
+            "total_words": total_words,
+            "processing_timestamp": processing_timestamp,
             "processing_status": "success",
             "extraction_method": "playwright" if content_type == 'text/html' else "pymupdf"
         }
     
     def _save_parsed_document(self, parsed_doc: Dict[str, Any], file_path: str) -> None:
         """Save parsed document to file."""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(parsed_doc, f, indent=2, ensure_ascii=False)
-    
+        self._write_bytes(file_path, orjson.dumps(parsed_doc, option=orjson.OPT_INDENT_2))
+
     def _save_metadata(self, metadata: Dict[str, Any], file_path: str) -> None:
         """Save metadata to file."""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False) 
\ No newline at end of file
+        self._write_bytes(file_path, orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+
+    def _save_chunk_sidecar(self, chunks: List[Dict[str, Any]], parsed_file_path: str) -> None:
+        """Write chunks as JSONL plus a byte-offset index.
+
+        One chunk per line with a companion array('Q') of line-start
+        offsets lets readers slice out exactly the chunks a page needs
+        instead of parsing the full document JSON; see
+        DocumentService.get_document_chunks.
+        """
+        if parsed_file_path.endswith("_parsed.json"):
+            base = parsed_file_path[:-len("_parsed.json")]
+        else:
+            base = os.path.splitext(parsed_file_path)[0]
+
+        offsets = array.array('Q')
+        position = 0
+        lines = []
+        for chunk in chunks:
+            line = orjson.dumps(chunk) + b'\n'
+            offsets.append(position)
+            position += len(line)
+            lines.append(line)
+
+        self._write_bytes(f"{base}_chunks.jsonl", b''.join(lines))
+        self._write_bytes(f"{base}_chunks.idx", offsets.tobytes())
+
+    @staticmethod
+    def _write_bytes(file_path: str, payload: bytes) -> None:
+        """Write a serialized payload with a single write syscall.
+
+        orjson already hands back one contiguous bytes object, so a
+        raw file descriptor avoids the buffered-file layer copying it
+        again; for multi-MB parsed documents that is one open, one
+        write, one close.
+        """
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd) 
\ No newline at end of file
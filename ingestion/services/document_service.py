@@ -1,14 +1,40 @@
 """Document management service for compliance documents."""
 
-import json
+import array
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+import orjson
+
 from core.config import get_settings
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Edge punctuation stripped from tokens when building/querying the
+# search index, so "compliance," and "compliance" share a posting list.
+_TOKEN_PUNCTUATION = '.,;:!?()[]{}"\''
+
+
+@lru_cache(maxsize=256)
+def _load_parsed(path_str: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Load and parse a JSON document, memoized on (path, mtime).
+
+    The mtime key makes rewritten files miss the cache naturally, so
+    repeat reads of unchanged documents (every search query re-reads
+    the whole corpus) cost a stat instead of a read + parse. Callers
+    must treat the returned dict as shared and copy before mutating.
+    """
+    try:
+        return orjson.loads(Path(path_str).read_bytes())
+    except Exception as e:
+        logger.error(f"Error loading document {path_str}: {e}")
+        return None
+
 
 class DocumentService:
     """Service for managing and retrieving processed documents."""
@@ -18,68 +44,101 @@ class DocumentService:
         self.parsed_dir = self.settings.parsed_output_path
         self.metadata_dir = self.settings.metadata_output_path
         self.raw_dir = self.settings.raw_output_path
-    
+        # Directory listing cache, invalidated when the parsed dir's
+        # mtime changes (files added or removed).
+        self._listing_cache: Optional[Dict[str, Any]] = None
+        self._listing_mtime_ns: Optional[int] = None
+        # Inverted search index, same invalidation rule as the listing
+        self._token_index: Optional[Dict[str, set]] = None
+        self._index_mtime_ns: Optional[int] = None
+        # Raw-dir filename index, same invalidation rule
+        self._raw_index: Optional[Dict[str, Path]] = None
+        self._raw_mtime_ns: Optional[int] = None
+
     def list_all_documents(self) -> Dict[str, Any]:
         """List all processed documents with basic information."""
         if not self.parsed_dir.exists():
             return {"documents": [], "total": 0}
-        
-        documents = []
-        
-        # Scan parsed directory for processed documents
-        for parsed_file in self.parsed_dir.glob("*_parsed.json"):
-            try:
-                # Extract document ID from filename
-                filename = parsed_file.stem
-                if filename.endswith("_parsed"):
-                    doc_id = filename[:-7]  # Remove _parsed suffix
-                else:
-                    continue
-                
-                # Load basic document info
-                with open(parsed_file, 'r', encoding='utf-8') as f:
-                    doc_data = json.load(f)
-                
-                # Load metadata if available
-                metadata_file = self.metadata_dir / f"{doc_id}_metadata.json"
-                metadata = {}
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                    except Exception as e:
-                        logger.warning(f"Failed to load metadata for {doc_id}: {e}")
-                
-                # Count chunks
-                chunks = doc_data.get("chunks", [])
-                if not chunks:
-                    chunks = doc_data.get("content_chunks", [])
-                
-                doc_info = {
-                    "document_id": doc_id,
-                    "source_name": doc_data.get("source_name", metadata.get("source_name", "Unknown")),
-                    "url": metadata.get("source_url", "Unknown"),
-                    "file_size": parsed_file.stat().st_size,
-                    "chunk_count": len(chunks),
-                    "processing_date": metadata.get("processing_date"),
-                    "content_type": metadata.get("content_type", "text"),
-                    "source_type": metadata.get("source_type", "html")
-                }
-                
-                documents.append(doc_info)
-                
-            except Exception as e:
-                logger.error(f"Error processing document {parsed_file}: {e}")
-        
+
+        # One stat on the directory decides whether the cached listing
+        # is still valid; ingestion adds/removes files, bumping mtime.
+        dir_mtime_ns = self.parsed_dir.stat().st_mtime_ns
+        if self._listing_cache is not None and self._listing_mtime_ns == dir_mtime_ns:
+            return self._listing_cache
+
+        # scandir surfaces name/type/stat from one directory read
+        # instead of the extra per-entry syscalls Path.glob issues.
+        with os.scandir(self.parsed_dir) as entries:
+            parsed_entries = [
+                entry for entry in entries
+                if entry.name.endswith("_parsed.json") and entry.is_file()
+            ]
+
+        # Per-file loads are independent I/O + parse work, so fan them
+        # out over a thread pool; reads release the GIL, giving
+        # near-linear scaling until storage bandwidth saturates.
+        with ThreadPoolExecutor(
+            max_workers=min(16, (os.cpu_count() or 4) * 2)
+        ) as executor:
+            documents = [
+                doc_info
+                for doc_info in executor.map(self._load_doc_info, parsed_entries)
+                if doc_info is not None
+            ]
+
         # Sort by processing date (newest first)
         documents.sort(key=lambda x: x.get("processing_date", ""), reverse=True)
-        
-        return {
+
+        listing = {
             "documents": documents,
             "total": len(documents),
             "total_size_mb": round(sum(doc["file_size"] for doc in documents) / (1024 * 1024), 2),
             "total_chunks": sum(doc["chunk_count"] for doc in documents)
         }
+        self._listing_cache = listing
+        self._listing_mtime_ns = dir_mtime_ns
+        return listing
+
+    def _load_doc_info(self, entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """Build the listing entry for one parsed DirEntry; None to skip."""
+        try:
+            # Extract document ID from filename (strip "_parsed.json")
+            doc_id = entry.name[:-len("_parsed.json")]
+
+            # Load basic document info; DirEntry caches its stat result
+            file_stat = entry.stat()
+            doc_data = _load_parsed(entry.path, file_stat.st_mtime_ns)
+            if doc_data is None:
+                return None
+
+            # Load metadata if available
+            metadata_file = self.metadata_dir / f"{doc_id}_metadata.json"
+            metadata = {}
+            if metadata_file.exists():
+                try:
+                    metadata = orjson.loads(metadata_file.read_bytes())
+                except Exception as e:
+                    logger.warning(f"Failed to load metadata for {doc_id}: {e}")
+
+            # Count chunks
+            chunks = doc_data.get("chunks", [])
+            if not chunks:
+                chunks = doc_data.get("content_chunks", [])
+
+            return {
+                "document_id": doc_id,
+                "source_name": doc_data.get("source_name", metadata.get("source_name", "Unknown")),
+                "url": metadata.get("source_url", "Unknown"),
+                "file_size": file_stat.st_size,
+                "chunk_count": len(chunks),
+                "processing_date": metadata.get("processing_date"),
+                "content_type": metadata.get("content_type", "text"),
+                "source_type": metadata.get("source_type", "html")
+            }
+
+        except Exception as e:
+            logger.error(f"Error processing document {entry.path}: {e}")
+            return None
     
     def get_document_by_id(self, document_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a specific document by its ID."""
@@ -89,25 +148,22 @@ class DocumentService:
             logger.warning(f"Document {document_id} not found")
             return None
         
-        try:
-            with open(parsed_file, 'r', encoding='utf-8') as f:
-                document = json.load(f)
-            
-            # Load metadata if available
-            metadata_file = self.metadata_dir / f"{document_id}_metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                    document["metadata"] = metadata
-                except Exception as e:
-                    logger.warning(f"Failed to load metadata for {document_id}: {e}")
-            
-            return document
-            
-        except Exception as e:
-            logger.error(f"Error loading document {document_id}: {e}")
+        document = _load_parsed(str(parsed_file), parsed_file.stat().st_mtime_ns)
+        if document is None:
             return None
+
+        # Shallow copy so attaching metadata doesn't mutate the cached dict
+        document = dict(document)
+
+        # Load metadata if available
+        metadata_file = self.metadata_dir / f"{document_id}_metadata.json"
+        if metadata_file.exists():
+            try:
+                document["metadata"] = orjson.loads(metadata_file.read_bytes())
+            except Exception as e:
+                logger.warning(f"Failed to load metadata for {document_id}: {e}")
+
+        return document
     
     def get_document_metadata(self, document_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve metadata for a specific document."""
@@ -117,14 +173,67 @@ class DocumentService:
             return None
         
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.loads(metadata_file.read_bytes())
         except Exception as e:
             logger.error(f"Error loading metadata for {document_id}: {e}")
             return None
     
+    def _read_sidecar_chunks(
+        self, document_id: str, start: int, limit: int
+    ) -> Optional[Dict[str, Any]]:
+        """Slice a page of chunks out of the JSONL sidecar, if present.
+
+        The ingest pipeline writes one chunk per line plus an array('Q')
+        of line-start offsets; mmap + the offset table parse only the
+        requested lines, so page cost is O(limit) regardless of how many
+        chunks the document has. Returns None for legacy documents
+        without a sidecar (or a stale one), letting the caller fall back
+        to the full-document path.
+        """
+        jsonl_file = self.parsed_dir / f"{document_id}_chunks.jsonl"
+        idx_file = self.parsed_dir / f"{document_id}_chunks.idx"
+        if not (jsonl_file.exists() and idx_file.exists()):
+            return None
+
+        try:
+            offsets = array.array('Q')
+            offsets.frombytes(idx_file.read_bytes())
+            total_chunks = len(offsets)
+
+            chunks = []
+            if start < total_chunks:
+                with open(jsonl_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    end_index = min(start + limit, total_chunks)
+                    for i in range(start, end_index):
+                        begin = offsets[i]
+                        end = offsets[i + 1] if i + 1 < total_chunks else len(view)
+                        chunks.append(orjson.loads(view[begin:end]))
+        except Exception as e:
+            logger.warning(f"Failed to read chunk sidecar for {document_id}: {e}")
+            return None
+
+        return {"chunks": chunks, "total": total_chunks}
+
     def get_document_chunks(self, document_id: str, start: int = 0, limit: int = 10) -> Dict[str, Any]:
         """Retrieve paginated chunks from a document."""
+        sidecar = self._read_sidecar_chunks(document_id, start, limit)
+        if sidecar is not None:
+            metadata = self.get_document_metadata(document_id) or {}
+            total_chunks = sidecar["total"]
+            return {
+                "document_id": document_id,
+                "source_name": metadata.get("source_name", "Unknown"),
+                "chunks": sidecar["chunks"],
+                "pagination": {
+                    "start": start,
+                    "limit": limit,
+                    "total": total_chunks,
+                    "has_more": start + limit < total_chunks,
+                    "next_start": start + limit if start + limit < total_chunks else None
+                }
+            }
+
         document = self.get_document_by_id(document_id)
         
         if not document:
@@ -151,40 +260,129 @@ class DocumentService:
             }
         }
     
+    def _load_document_chunks(self, document_id: str) -> List[Dict[str, Any]]:
+        """Load a document's chunk list via the parsed-doc cache."""
+        parsed_file = self.parsed_dir / f"{document_id}_parsed.json"
+        try:
+            mtime_ns = parsed_file.stat().st_mtime_ns
+        except OSError:
+            return []
+        document = _load_parsed(str(parsed_file), mtime_ns)
+        if not document:
+            return []
+        chunks = document.get("chunks", [])
+        if not chunks:
+            chunks = document.get("content_chunks", [])
+        return chunks
+
+    def _ensure_index(self) -> Optional[Dict[str, set]]:
+        """Build (or reuse) the token -> {(doc_id, chunk_pos)} index.
+
+        Tokens are lowercased whitespace words with edge punctuation
+        stripped. The index is rebuilt only when the parsed directory's
+        mtime moves, same invalidation rule as the listing cache.
+        """
+        if not self.parsed_dir.exists():
+            return None
+        dir_mtime_ns = self.parsed_dir.stat().st_mtime_ns
+        if self._token_index is not None and self._index_mtime_ns == dir_mtime_ns:
+            return self._token_index
+
+        index: Dict[str, set] = {}
+        for doc_info in self.list_all_documents()["documents"]:
+            doc_id = doc_info["document_id"]
+            for pos, chunk in enumerate(self._load_document_chunks(doc_id)):
+                content = chunk.get("content", chunk.get("text", ""))
+                for token in content.lower().split():
+                    token = token.strip(_TOKEN_PUNCTUATION)
+                    if token:
+                        index.setdefault(token, set()).add((doc_id, pos))
+
+        self._token_index = index
+        self._index_mtime_ns = dir_mtime_ns
+        return index
+
     def search_documents(self, query: str, limit: int = 50) -> Dict[str, Any]:
-        """Search across all documents for specific content."""
+        """Search across all documents for specific content.
+
+        When every query token exists in the inverted index, candidate
+        chunks come from intersecting the posting lists and only those
+        few chunks get the substring verification, so repeat queries
+        never rescan the corpus. Queries with tokens the index has
+        never seen (e.g. partial words) fall back to the linear scan.
+        """
         all_docs = self.list_all_documents()["documents"]
         matching_chunks = []
-        
+
         query_lower = query.lower()
-        
+
+        index = self._ensure_index()
+        query_tokens = [
+            token for token in (
+                raw.strip(_TOKEN_PUNCTUATION) for raw in query_lower.split()
+            ) if token
+        ]
+
+        if index is not None and query_tokens and all(t in index for t in query_tokens):
+            candidates = set.intersection(*(index[t] for t in query_tokens))
+            source_names = {d["document_id"]: d["source_name"] for d in all_docs}
+            chunks_by_doc: Dict[str, List[Dict[str, Any]]] = {}
+
+            for doc_id, pos in sorted(candidates):
+                if len(matching_chunks) >= limit:
+                    break
+                if doc_id not in chunks_by_doc:
+                    chunks_by_doc[doc_id] = self._load_document_chunks(doc_id)
+                chunks = chunks_by_doc[doc_id]
+                if pos >= len(chunks):
+                    continue
+                chunk = chunks[pos]
+                content = chunk.get("content", chunk.get("text", ""))
+                # Verify the full query as a substring; the token
+                # intersection does not guarantee adjacency.
+                if query_lower in content.lower():
+                    matching_chunks.append({
+                        "document_id": doc_id,
+                        "source_name": source_names.get(doc_id, "Unknown"),
+                        "chunk_id": chunk.get("chunk_id", "unknown"),
+                        "chunk_index": chunk.get("chunk_index", 0),
+                        "content": content,
+                        "word_count": chunk.get("word_count", 0)
+                    })
+
+            return {
+                "query": query,
+                "matching_chunks": matching_chunks,
+                "total_matches": len(matching_chunks),
+                "searched_documents": len(all_docs)
+            }
+
         for doc_info in all_docs:
-            document = self.get_document_by_id(doc_info["document_id"])
-            if not document:
-                continue
-            
-            chunks = document.get("chunks", [])
-            if not chunks:
-                chunks = document.get("content_chunks", [])
-            
+            # Check the limit before paying for the next document load
+            if len(matching_chunks) >= limit:
+                break
+
+            # Load straight from the parsed-doc cache; the metadata
+            # attachment get_document_by_id does is dead weight here.
+            chunks = self._load_document_chunks(doc_info["document_id"])
+
             for chunk in chunks:
-                chunk_text = chunk.get("content", chunk.get("text", "")).lower()
-                
-                if query_lower in chunk_text:
+                content = chunk.get("content", chunk.get("text", ""))
+
+                # Probe the raw text first; lowering the chunk copies
+                # it, and most hits are already lowercase in context.
+                if query_lower in content or query_lower in content.lower():
                     matching_chunks.append({
                         "document_id": doc_info["document_id"],
                         "source_name": doc_info["source_name"],
                         "chunk_id": chunk.get("chunk_id", "unknown"),
                         "chunk_index": chunk.get("chunk_index", 0),
-                        "content": chunk.get("content", chunk.get("text", "")),
+                        "content": content,
                         "word_count": chunk.get("word_count", 0)
                     })
-                    
+
                     if len(matching_chunks) >= limit:
                         break
-            
-            if len(matching_chunks) >= limit:
-                break
         
         return {
             "query": query,
@@ -193,19 +391,44 @@ class DocumentService:
             "searched_documents": len(all_docs)
         }
     
+    def _refresh_raw_index(self) -> Optional[Dict[str, Path]]:
+        """Map raw filenames to paths, rebuilt when the dir mtime moves."""
+        if not self.raw_dir.exists():
+            return None
+        raw_mtime_ns = self.raw_dir.stat().st_mtime_ns
+        if self._raw_index is not None and self._raw_mtime_ns == raw_mtime_ns:
+            return self._raw_index
+
+        with os.scandir(self.raw_dir) as entries:
+            self._raw_index = {
+                entry.name: Path(entry.path)
+                for entry in entries if entry.is_file()
+            }
+        self._raw_mtime_ns = raw_mtime_ns
+        return self._raw_index
+
     def get_raw_file(self, document_id: str) -> Optional[Path]:
-        """Get the path to the raw downloaded file for a document."""
+        """Get the path to the raw downloaded file for a document.
+
+        The old version issued up to four exists() stats plus a glob
+        per call; lookups now hit a cached filename index that costs
+        one stat on the directory to validate.
+        """
+        raw_index = self._refresh_raw_index()
+        if raw_index is None:
+            return None
+
         # Check for various file extensions
         for ext in ['.pdf', '.html', '.txt', '.json']:
-            raw_file = self.raw_dir / f"{document_id}{ext}"
-            if raw_file.exists():
+            raw_file = raw_index.get(f"{document_id}{ext}")
+            if raw_file is not None:
                 return raw_file
-        
+
         # Try with timestamp pattern
-        for raw_file in self.raw_dir.glob(f"{document_id}*"):
-            if raw_file.is_file():
-                return raw_file
-        
+        for name in raw_index:
+            if name.startswith(document_id):
+                return raw_index[name]
+
         return None
     
     def get_document_statistics(self) -> Dict[str, Any]:
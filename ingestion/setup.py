@@ -25,8 +25,9 @@ setup(
         "python-dotenv>=1.0.0",
         "rich>=13.0.0",
         "inngest>=0.3.0",
+        "orjson>=3.9.0",
         "fastapi>=0.104.0",
-        "uvicorn>=0.24.0",
+        "uvicorn[standard]>=0.24.0",
     ],
     extras_require={
         "dev": [